@@ -1,13 +1,131 @@
+import functools
 import json
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
-import bibtexparser
+try:
+    import orjson          # optional C encoder, much faster than json
+except ImportError:
+    orjson = None
 
 
 ROOT = Path(__file__).resolve().parents[1]
 BIB = ROOT / "data" / "publications.bib"
 OUT = ROOT / "data" / "publications.json"
+AUTHOR_LINKS = ROOT / "data" / "author_links.json"
+STAMP = OUT.with_suffix(".json.stamp")
+
+# Below this many entries, worker startup costs more than it saves.
+PARALLEL_THRESHOLD = 500
+
+# Compiled once at import; these run per field per entry.
+_AND = re.compile(r"\s+and\s+")
+_YEAR = re.compile(r"\b(\d{4})\b")
+
+# Drop braces and turn NBSP into plain space in one C-level pass.
+_CLEAN_TABLE = str.maketrans({"{": None, "}": None, "\u00a0": " "})
+
+# Start of an entry: @type{key,
+_ENTRY = re.compile(r"@(\w+)\s*\{\s*([^,\s{}]+)\s*,")
+# field name followed by '='
+_FIELD = re.compile(r"\s*([\w-]+)\s*=\s*")
+
+
+def scan_bib(text: str) -> list[dict]:
+    """
+    Minimal BibTeX scanner for the handful of fields this script needs.
+    Handles {braced} (with nesting), "quoted" and bare values; @comment/
+    @string/@preamble blocks are skipped. Raises ValueError on anything it
+    cannot make sense of, so the caller can fall back to bibtexparser.
+    Returns one plain dict per entry: {"ID", "ENTRYTYPE", <fields as written>}.
+    """
+    entries = []
+    n = len(text)
+    for m in _ENTRY.finditer(text):
+        entry_type = m.group(1).lower()
+        if entry_type in ("comment", "string", "preamble"):
+            continue
+        fields = {"ID": m.group(2), "ENTRYTYPE": entry_type}
+        i = m.end()
+        while True:
+            fm = _FIELD.match(text, i)
+            if not fm:
+                break
+            name = fm.group(1)
+            i = fm.end()
+            if i < n and text[i] == "{":
+                # walk balanced braces
+                depth, j = 1, i + 1
+                while j < n and depth:
+                    c = text[j]
+                    if c == "{":
+                        depth += 1
+                    elif c == "}":
+                        depth -= 1
+                    j += 1
+                if depth:
+                    raise ValueError(f"unbalanced braces in @{entry_type}{{{fields['ID']}}}")
+                value = text[i + 1:j - 1]
+                i = j
+            elif i < n and text[i] == '"':
+                j = text.find('"', i + 1)
+                if j < 0:
+                    raise ValueError(f"unterminated quote in @{entry_type}{{{fields['ID']}}}")
+                value = text[i + 1:j]
+                i = j + 1
+            else:
+                # bare value (number or macro) up to , or }
+                j = i
+                while j < n and text[j] not in ",}":
+                    j += 1
+                value = text[i:j].strip()
+                i = j
+            fields[name] = value
+            # skip whitespace, then a comma continues the field list
+            while i < n and text[i].isspace():
+                i += 1
+            if i < n and text[i] == ",":
+                i += 1
+            else:
+                break
+        # The loop must have stopped at the entry's closing brace; anything
+        # else (e.g. '#' string concatenation) would mean silently dropping
+        # the rest of the entry, so hand those off to bibtexparser instead.
+        while i < n and text[i].isspace():
+            i += 1
+        if i >= n or text[i] != "}":
+            raise ValueError(
+                f"unexpected {text[i:i + 1]!r} in @{entry_type}{{{fields['ID']}}}"
+            )
+        entries.append(fields)
+    return entries
+
+
+def parse_bib_fallback(text: str) -> list[dict]:
+    """Full bibtexparser parse, converted to the same dict shape scan_bib
+    emits. Only imported/used when the fast scanner gives up."""
+    import bibtexparser
+    from bibtexparser.middlewares import RemoveEnclosingMiddleware
+
+    library = bibtexparser.parse_string(
+        text, parse_stack=[RemoveEnclosingMiddleware()]
+    )
+    return [
+        {"ID": e.key, "ENTRYTYPE": e.entry_type,
+         **{name: f.value for name, f in e.fields_dict.items()}}
+        for e in library.entries
+    ]
+
+
+def source_stamp() -> str:
+    """mtimes of the inputs, so unchanged builds can be skipped entirely."""
+    bib_mtime = BIB.stat().st_mtime_ns
+    links_mtime = AUTHOR_LINKS.stat().st_mtime_ns if AUTHOR_LINKS.exists() else 0
+    return f"{bib_mtime} {links_mtime}"
 
 
 def clean_text(s: str) -> str:
@@ -18,25 +136,26 @@ def clean_text(s: str) -> str:
     """
     if not s:
         return ""
-    s = s.replace("\u00a0", " ")          # NBSP -> normal space
-    s = re.sub(r"[{}]", "", s)            # remove braces
-    s = " ".join(s.split())               # collapse whitespace/newlines/tabs
-    return s.strip()
+    # translate removes braces and maps NBSP to space in one pass,
+    # then split/join collapses whitespace/newlines/tabs.
+    return " ".join(s.translate(_CLEAN_TABLE).split())
 
 
-def split_authors(author_field: str) -> list[str]:
+def split_authors(author_field) -> list[str]:
     """
-    Robustly split BibTeX author string.
-    BibTeX separator is 'and'. People may have newlines or multiple spaces around it.
+    Normalize the BibTeX author field into a list of names.
+    Both scan_bib and parse_bib_fallback deliver the field as a raw string,
+    which gets split on 'and'; a pre-split list is accepted defensively.
     Example:
       "Kim, Jaehyun and Shin, Cheolmin and Park, Hyungbin"
-      "Kim, Jaehyun\nand Shin, Cheolmin and  Park, Hyungbin"
+      -> ["Kim, Jaehyun", "Shin, Cheolmin", "Park, Hyungbin"]
     """
-    s = clean_text(author_field)
-    if not s:
-        return []
-    parts = [p.strip().rstrip(",") for p in re.split(r"\s+and\s+", s) if p.strip()]
-    return parts
+    if isinstance(author_field, str):
+        names = _AND.split(clean_text(author_field))
+    else:
+        names = author_field or []
+    # intern: the same co-authors recur across entries, share one str each
+    return [sys.intern(clean_text(n).rstrip(",")) for n in names if n and n.strip()]
 
 
 def to_int_year(year_raw: str) -> int:
@@ -44,7 +163,7 @@ def to_int_year(year_raw: str) -> int:
     if not s:
         return 0
     # Sometimes year can be "2025a" or "{2025}" etc. Try to extract first 4 digits.
-    m = re.search(r"\b(\d{4})\b", s)
+    m = _YEAR.search(s)
     if m:
         return int(m.group(1))
     try:
@@ -53,6 +172,31 @@ def to_int_year(year_raw: str) -> int:
         return 0
 
 
+@functools.lru_cache(maxsize=1)
+def load_author_links() -> dict:
+    """author_links.json maps 'Last, First' -> homepage URL. Keys are
+    normalized the same way as split_authors output so lookups match.
+    Cached: the file is read and normalized at most once per process."""
+    if AUTHOR_LINKS.exists():
+        raw = json.loads(AUTHOR_LINKS.read_text(encoding="utf-8"))
+        return {clean_text(k).rstrip(","): v for k, v in raw.items()}
+    return {}
+
+
+# Field-priority lists for first_of lookups.
+_VENUE_FIELDS = ("journal", "booktitle", "publisher", "institution")
+_ARCHIVE_FIELDS = ("archivePrefix", "archiveprefix")
+
+
+def first_of(d: dict, keys) -> str:
+    """First truthy d[key] over keys, stopping at the first hit."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return ""
+
+
 def make_arxiv_link(entry: dict) -> str:
     """
     Support common patterns:
@@ -66,7 +210,7 @@ def make_arxiv_link(entry: dict) -> str:
         return f"https://arxiv.org/abs/{arxiv}"
 
     eprint = clean_text(entry.get("eprint", ""))
-    archive = clean_text(entry.get("archivePrefix", entry.get("archiveprefix", ""))).lower()
+    archive = clean_text(first_of(entry, _ARCHIVE_FIELDS)).lower()
 
     if eprint and (archive == "arxiv"):
         return f"https://arxiv.org/abs/{eprint}"
@@ -80,12 +224,44 @@ def make_arxiv_link(entry: dict) -> str:
 
 
 def pick_venue(entry: dict) -> str:
-    return clean_text(
-        entry.get("journal")
-        or entry.get("booktitle")
-        or entry.get("publisher")
-        or entry.get("institution")
-        or ""
+    return clean_text(first_of(entry, _VENUE_FIELDS))
+
+
+@dataclass(slots=True)
+class Pub:
+    """One output row; field order is the JSON key order."""
+    id: str = ""
+    type: str = ""
+    title: str = ""
+    # 이름 + 홈페이지 링크 (index.html에서 바로 렌더링)
+    authors: list = field(default_factory=list)
+    venue: str = ""
+    year: int = 0
+
+    # Links (형태는 너가 HTML에서 어떻게 쓰든 확장 가능)
+    url: str = ""          # 저널/공식 페이지 링크로 쓰기 좋음
+    doi: str = ""
+    arxiv: str = ""
+    pdf: str = ""
+    code: str = ""
+
+
+def build_entry(e: dict, author_links: dict) -> Pub:
+    names = split_authors(e.get("author", ""))
+
+    return Pub(
+        id=e.get("ID", ""),
+        type=e.get("ENTRYTYPE", ""),
+        title=clean_text(e.get("title", "")),
+        authors=[{"name": n, "url": author_links.get(n, "")} for n in names],
+        venue=sys.intern(pick_venue(e)),  # venues repeat a lot too
+        year=to_int_year(e.get("year", "")),
+        url=clean_text(e.get("url", "")),
+        doi=clean_text(e.get("doi", "")),
+        arxiv=make_arxiv_link(e),
+        # Optional custom fields you might add to BibTeX
+        pdf=clean_text(e.get("pdf", "")),
+        code=clean_text(e.get("code", "")),
     )
 
 
@@ -93,46 +269,53 @@ def main():
     if not BIB.exists():
         raise FileNotFoundError(f"Missing BibTeX file: {BIB}")
 
-    with BIB.open("r", encoding="utf-8") as f:
-        db = bibtexparser.load(f)
+    # Skip the whole build when nothing changed since the last run.
+    stamp = source_stamp()
+    if OUT.exists() and STAMP.exists() and STAMP.read_text() == stamp:
+        print(f"{OUT} up to date")
+        return
 
-    pubs = []
-    for e in db.entries:
-        title = clean_text(e.get("title", ""))
-        authors = split_authors(e.get("author", ""))
-        year = to_int_year(e.get("year", ""))
-        venue = pick_venue(e)
+    # Read once as bytes and decode in a single pass (a stray non-UTF-8 byte
+    # shouldn't kill the build). The fast scanner covers everything this
+    # .bib actually contains; bibtexparser stays as the safety net.
+    text = BIB.read_bytes().decode("utf-8", "replace")
+    try:
+        entries = scan_bib(text)
+    except ValueError as exc:
+        print(f"scan_bib gave up ({exc}); using bibtexparser")
+        entries = parse_bib_fallback(text)
 
-        doi = clean_text(e.get("doi", ""))
-        url = clean_text(e.get("url", ""))
+    author_links = load_author_links()
 
-        # Optional custom fields you might add to BibTeX
-        pdf = clean_text(e.get("pdf", ""))
-        code = clean_text(e.get("code", ""))
-
-        arxiv = make_arxiv_link(e)
-
-        pubs.append({
-            "id": e.get("ID", ""),
-            "type": e.get("ENTRYTYPE", ""),
-            "title": title,
-            "authors": authors,    # 형태 A 유지!
-            "venue": venue,
-            "year": year,
-
-            # Links (형태는 너가 HTML에서 어떻게 쓰든 확장 가능)
-            "url": url,            # 저널/공식 페이지 링크로 쓰기 좋음
-            "doi": doi,
-            "arxiv": arxiv,
-            "pdf": pdf,
-            "code": code,
-        })
+    if len(entries) > PARALLEL_THRESHOLD:
+        # Entry-to-dict conversion is embarrassingly parallel once parsed.
+        convert = functools.partial(build_entry, author_links=author_links)
+        with ProcessPoolExecutor() as ex:
+            pubs = list(ex.map(convert, entries, chunksize=64))
+    else:
+        pubs = [build_entry(e, author_links) for e in entries]
 
     # Sort newest first (year desc, then title)
-    pubs.sort(key=lambda x: (x["year"], x["title"]), reverse=True)
+    pubs.sort(key=attrgetter("year", "title"), reverse=True)
+
+    if orjson is not None:
+        # orjson serializes (slots) dataclasses natively
+        new = orjson.dumps(pubs, option=orjson.OPT_INDENT_2)
+    else:
+        new = json.dumps(
+            [asdict(p) for p in pubs], ensure_ascii=False, indent=2
+        ).encode("utf-8")
 
     OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(pubs, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Don't touch the file when nothing changed: keeps the mtime stable so
+    # Pages/CI and browser caches don't see a spurious update.
+    if OUT.exists() and OUT.read_bytes() == new:
+        STAMP.write_text(stamp)
+        print(f"{OUT} unchanged ({len(pubs)} items)")
+        return
+
+    OUT.write_bytes(new)
+    STAMP.write_text(stamp)
     print(f"Wrote {OUT} ({len(pubs)} items)")
 
 